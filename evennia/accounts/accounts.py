@@ -62,6 +62,8 @@ _CMDSET_ACCOUNT = settings.CMDSET_ACCOUNT
 _MUDINFO_CHANNEL = None
 _CONNECT_CHANNEL = None
 _CMDHANDLER = None
+# search terms that make DefaultAccount.search return the account itself
+_SELF_SEARCH_TERMS = frozenset(("me", "*me", "self", "*self"))
 
 
 # Create throttles for too many account-creations and login attempts
@@ -152,8 +154,22 @@ class CharactersHandler:
             self.owner.db._playable_characters = []
 
     def _clean(self):
-        # Remove all instances of None from the list.
-        self.owner.db._playable_characters = [x for x in self.owner.db._playable_characters if x]
+        """
+        Get the playable characters, removing all instances of None
+        (deleted characters) from the stored list.
+
+        Returns:
+            list[DefaultCharacter]: All playable characters.
+
+        Notes:
+            The Attribute is only saved if something was removed.
+
+        """
+        characters = self.owner.db._playable_characters or []
+        cleaned = [x for x in characters if x]
+        if len(cleaned) != len(characters):
+            self.owner.db._playable_characters = cleaned
+        return cleaned
 
     def add(self, character: "DefaultCharacter"):
         """
@@ -162,9 +178,10 @@ class CharactersHandler:
         Args:
             character (DefaultCharacter): The character to add.
         """
-        self._clean()
-        if character not in self.owner.db._playable_characters:
-            self.owner.db._playable_characters.append(character)
+        characters = self._clean()
+        if character not in characters:
+            characters.append(character)
+            self.owner.db._playable_characters = characters
             self.owner.at_post_add_character(character)
 
     def remove(self, character: "DefaultCharacter"):
@@ -174,9 +191,10 @@ class CharactersHandler:
         Args:
             character (DefaultCharacter): The character to remove.
         """
-        self._clean()
-        if character in self.owner.db._playable_characters:
-            self.owner.db._playable_characters.remove(character)
+        characters = self._clean()
+        if character in characters:
+            characters.remove(character)
+            self.owner.db._playable_characters = characters
             self.owner.at_post_remove_character(character)
 
     def all(self) -> list["DefaultCharacter"]:
@@ -186,8 +204,7 @@ class CharactersHandler:
         Returns:
             list[DefaultCharacter]: All playable characters.
         """
-        self._clean()
-        return list(self.owner.db._playable_characters)
+        return self._clean()
 
     def count(self) -> int:
         """
@@ -487,20 +504,21 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
         if obj.account:
             # object already puppeted
             if obj.account == self:
-                if obj.sessions.count():
+                other_sessions = obj.sessions.all()
+                if other_sessions:
                     # we may take over another of our sessions
                     # output messages to the affected sessions
                     if _MULTISESSION_MODE in (1, 3):
                         txt1 = f"Sharing |c{obj.name}|n with another of your sessions."
                         txt2 = f"|c{obj.name}|n|G is now shared from another of your sessions.|n"
                         self.msg(txt1, session=session)
-                        self.msg(txt2, session=obj.sessions.all())
+                        self.msg(txt2, session=other_sessions)
                     else:
                         txt1 = f"Taking over |c{obj.name}|n from another of your sessions."
                         txt2 = f"|c{obj.name}|n|R is now acted from another of your sessions.|n"
                         self.msg(txt1, session=session)
-                        self.msg(txt2, session=obj.sessions.all())
-                        self.unpuppet_object(obj.sessions.get())
+                        self.msg(txt2, session=other_sessions)
+                        self.unpuppet_object(other_sessions)
             elif obj.account.is_connected:
                 # controlled by another account
                 self.msg(_("|c{key}|R is already puppeted by another Account.").format(key=obj.key))
@@ -520,7 +538,7 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
                 not self.is_superuser
                 and not self.check_permstring("Developer")
                 and obj not in already_puppeted
-                and len(self.get_all_puppets()) >= _MAX_NR_SIMULTANEOUS_PUPPETS
+                and len(already_puppeted) >= _MAX_NR_SIMULTANEOUS_PUPPETS
             ):
                 self.msg(
                     _(f"You cannot control any more puppets (max {_MAX_NR_SIMULTANEOUS_PUPPETS})")
@@ -599,10 +617,16 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
 
         Returns:
             puppets (list): All puppeted objects currently controlled
-                by this Account.
+                by this Account, in the order of their sessions.
 
         """
-        return list(set(session.puppet for session in self.sessions.all() if session.puppet))
+        # dedupe on id to avoid hashing/comparing the model instances
+        puppets = {}
+        for session in self.sessions.all():
+            puppet = session.puppet
+            if puppet:
+                puppets.setdefault(puppet.id, puppet)
+        return list(puppets.values())
 
     def __get_single_puppet(self):
         """
@@ -614,10 +638,13 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
                 get a list of all puppeted objects.
 
         """
-        puppets = self.get_all_puppets()
         if _MULTISESSION_MODE in (0, 1):
-            return puppets and puppets[0] or None
-        return puppets
+            # return the first puppet found without collecting all of them
+            for session in self.sessions.all():
+                if session.puppet:
+                    return session.puppet
+            return None
+        return self.get_all_puppets()
 
     character = property(__get_single_puppet)
     puppet = property(__get_single_puppet)
@@ -1203,7 +1230,7 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
         kwargs["options"] = options
 
         if text is not None:
-            if not (isinstance(text, str) or isinstance(text, tuple)):
+            if not isinstance(text, (str, tuple)):
                 # sanitize text before sending across the wire
                 try:
                     text = to_str(text)
@@ -1388,7 +1415,7 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
         # handle me, self and *me, *self
         if isinstance(searchdata, str):
             # handle wrapping of common terms
-            if searchdata.lower() in ("me", "*me", "self", "*self"):
+            if searchdata.lower() in _SELF_SEARCH_TERMS:
                 return [self] if quiet else self
 
         searchdata = self.nicks.nickreplace(
@@ -1674,7 +1701,7 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
                 except ChannelDB.DoesNotExist:
                     logger.log_trace()
             else:
-                _MUDINFO = False
+                _MUDINFO_CHANNEL = False
         if _CONNECT_CHANNEL is None:
             if settings.CHANNEL_CONNECTINFO:
                 try:
@@ -1690,7 +1717,7 @@ class DefaultAccount(AccountDB, metaclass=TypeclassBase):
             now = timezone.localtime()
         else:
             now = timezone.now()
-        now = "%02i-%02i-%02i(%02i:%02i)" % (now.year, now.month, now.day, now.hour, now.minute)
+        now = now.strftime("%Y-%m-%d(%H:%M)")
         if _MUDINFO_CHANNEL:
             _MUDINFO_CHANNEL.msg(f"[{now}]: {message}")
         if _CONNECT_CHANNEL:
@@ -410,6 +410,14 @@ class TestDefaultAccountEv(BaseEvenniaTest):
         self.assertEqual(self.account.characters.all(), [self.char1])
         self.assertEqual(self.account.db._playable_characters, [self.char1])
 
+    def test_characters_read_without_saving(self):
+        "reading the playable characters doesn't save the Attribute"
+        self.account.characters.add(self.char1)
+        with patch.object(self.account.attributes, "add") as mock_add:
+            self.assertEqual(self.account.characters.all(), [self.char1])
+            self.assertEqual(len(self.account.characters), 1)
+            mock_add.assert_not_called()
+
     def test_add_character_to_playable_list(self):
         self.assertEqual(self.account.characters.all(), [])
         self.account.characters.add(self.char1)
@@ -427,6 +435,37 @@ class TestDefaultAccountEv(BaseEvenniaTest):
             self.account.puppet_object(self.session, self.char1)
             self.account.msg.assert_called_with("You are already puppeting this object.")
 
+    def test_get_all_puppets(self):
+        "puppets are listed once each, in the order of their sessions"
+        sessions = [
+            MagicMock(puppet=self.char2),
+            MagicMock(puppet=None),
+            MagicMock(puppet=self.char1),
+            MagicMock(puppet=self.char2),
+        ]
+        with patch.object(self.account.sessions, "all", return_value=sessions):
+            self.assertEqual(self.account.get_all_puppets(), [self.char2, self.char1])
+            with patch("evennia.accounts.accounts._MULTISESSION_MODE", 0):
+                self.assertEqual(self.account.puppet, self.char2)
+            with patch("evennia.accounts.accounts._MULTISESSION_MODE", 2):
+                self.assertEqual(self.account.puppet, [self.char2, self.char1])
+
+    def test_search_self(self):
+        "me/self search terms return the account itself"
+        self.assertEqual(self.account.search("*Me"), self.account)
+        self.assertEqual(self.account.search("self", quiet=True), [self.account])
+
+    @override_settings(CHANNEL_MUDINFO=None, CHANNEL_CONNECTINFO=None)
+    def test_send_to_connect_channel_disabled(self):
+        "disabled info channels are remembered as such"
+        with (
+            patch("evennia.accounts.accounts._MUDINFO_CHANNEL", None),
+            patch("evennia.accounts.accounts._CONNECT_CHANNEL", None),
+        ):
+            self.account._send_to_connect_channel("test")
+            self.assertIs(evennia.accounts.accounts._MUDINFO_CHANNEL, False)
+            self.assertIs(evennia.accounts.accounts._CONNECT_CHANNEL, False)
+
     @patch("evennia.accounts.accounts.time.time", return_value=10000)
     def test_idle_time(self, mock_time):
         self.session.cmd_last_visible = 10000 - 10
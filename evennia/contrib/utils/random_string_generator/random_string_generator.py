@@ -49,14 +49,22 @@ available.
 
 """
 
+import random
 import re
 import string
-import time
-from random import choice, randint, seed
 
 from evennia import DefaultScript, ScriptDB
 from evennia.utils.create import create_script
 
+# The global script and its `generated` mapping, cached on first use.  All
+# generators share the same mapping so they don't overwrite each other's
+# strings when it's saved.
+_SCRIPT = None
+_GENERATED = None
+
+# The characters a negated class like [^a-z] can pick from
+_NEGATED_CHARS = string.ascii_letters + string.digits
+
 
 class RejectedRegex(RuntimeError):
     """The provided regular expression has been rejected.
@@ -102,9 +110,9 @@ class RandomStringGenerator:
     The "rule" defining what the generator should provide in terms of
     string is given as a regular expression when creating instances of
     this class.  You can use the `all` method to get all generated strings,
-    the `get` method to generate a new string, the `remove` method
-    to remove a generated string, or the `clear` method to remove all
-    generated strings.
+    the `get` method to generate a new string, the `get_many` method to
+    generate several strings at once, the `remove` method to remove a
+    generated string, or the `clear` method to remove all generated strings.
 
     Bear in mind, however, that while the generated strings will be
     stored to avoid repetition, the generator will not concern itself
@@ -114,9 +122,14 @@ class RandomStringGenerator:
 
     """
 
-    # We keep the script as a class variable to optimize querying
-    # with multiple instandces
-    script = None
+    # Sets mirroring the stored strings of each generator, by name, so
+    # checking if a string was already generated doesn't scan the list
+    _generated_sets = {}
+
+    # Elements and total found for each regular expression, so generators
+    # sharing a regex only parse it once.  The elements are shared between
+    # these generators and should not be modified.
+    _parsed_regexes = {}
 
     def __init__(self, name, regex):
         """
@@ -146,6 +159,9 @@ class RandomStringGenerator:
         self.name = name
         self.elements = []
         self.total = 1
+        self._rng = random.Random()
+        # (chars, min, max) for each element, chars joined in a string
+        self._draw_elements = ()
 
         # Analyze the regex if any
         if regex:
@@ -160,8 +176,9 @@ class RandomStringGenerator:
 
     def _get_script(self):
         """Get or create the script."""
-        if type(self).script:
-            return type(self).script
+        global _SCRIPT
+        if _SCRIPT:
+            return _SCRIPT
 
         try:
             script = ScriptDB.objects.get(db_key="generator_script")
@@ -170,9 +187,47 @@ class RandomStringGenerator:
                 "evennia.contrib.utils.random_string_generator.RandomStringGeneratorScript"
             )
 
-        type(self).script = script
+        _SCRIPT = script
         return script
 
+    def _get_generated(self):
+        """
+        Get the mapping of generator names to stored strings.
+
+        Returns:
+            generated (dict): the `generated` attribute of the script,
+            loaded once and shared by all generators.
+
+        """
+        global _GENERATED
+        if _GENERATED is None:
+            _GENERATED = self._get_script().db.generated
+
+        return _GENERATED
+
+    def _get_generated_set(self, generated):
+        """
+        Get the set mirroring the strings stored for this generator.
+
+        Args:
+            generated (list): the strings stored in the script.
+
+        Returns:
+            generated_set (set): the same strings, as a set.
+
+        Notes:
+            The set is rebuilt if it doesn't hold as many strings as
+            the stored list, which is the case if the list was modified
+            elsewhere or if non-unique strings were stored.
+
+        """
+        generated_set = self._generated_sets.get(self.name)
+        if generated_set is None or len(generated_set) != len(generated):
+            generated_set = set(generated)
+            self._generated_sets[self.name] = generated_set
+
+        return generated_set
+
     def _find_elements(self, regex):
         """
         Find the elements described in the regular expression.  This will
@@ -182,6 +237,11 @@ class RandomStringGenerator:
             regex (str): the regular expression.
 
         """
+        key = (type(self), regex)
+        if key in self._parsed_regexes:
+            self.elements, self.total, self._draw_elements = self._parsed_regexes[key]
+            return
+
         try:
             # python 3.11
             regex_parser = re._parser
@@ -222,6 +282,11 @@ class RandomStringGenerator:
             self.elements.append(desc)
             self.total *= len(desc["chars"]) ** desc["max"]
 
+        self._draw_elements = tuple(
+            ("".join(desc["chars"]), desc["min"], desc["max"]) for desc in self.elements
+        )
+        self._parsed_regexes[key] = (self.elements, self.total, self._draw_elements)
+
     def _find_literal(self, element):
         """Find the literal corresponding to a piece of regular expression."""
         name = str(element[0]).lower()
@@ -230,21 +295,16 @@ class RandomStringGenerator:
             chars.append(chr(element[1]))
         elif name == "in":
             negate = False
-            if element[1][0][0] == "negate":
-                negate = True
-                chars = list(string.ascii_letters + string.digits)
-
             for part in element[1]:
-                if part[0] == "negate":
+                if str(part[0]).lower() == "negate":
+                    negate = True
                     continue
 
-                sublist = self._find_literal(part)
-                for char in sublist:
-                    if negate:
-                        if char in chars:
-                            chars.remove(char)
-                    else:
-                        chars.append(char)
+                chars.extend(self._find_literal(part))
+
+            if negate:
+                excluded = set(chars)
+                chars = [char for char in _NEGATED_CHARS if char not in excluded]
         elif name == "range":
             chars = [chr(i) for i in range(element[1][0], element[1][1] + 1)]
         elif name == "category":
@@ -252,7 +312,7 @@ class RandomStringGenerator:
             if category == "category_digit":
                 chars = list(string.digits)
             elif category == "category_word":
-                chars = list(string.letters)
+                chars = list(string.ascii_letters + string.digits + "_")
             else:
                 raise RejectedRegex("unknown category: {}".format(category))
         else:
@@ -260,6 +320,21 @@ class RandomStringGenerator:
 
         return chars
 
+    def _draw(self):
+        """
+        Draw a pseudo-random string according to the regular expression,
+        without checking if it was already generated.
+
+        Returns:
+            result (str): the drawn string.
+
+        """
+        rng = self._rng
+        return "".join(
+            "".join(rng.choices(chars, k=rng.randint(low, high)))
+            for chars, low, high in self._draw_elements
+        )
+
     def all(self):
         """
         Return all generated strings for this generator.
@@ -269,8 +344,7 @@ class RandomStringGenerator:
             used.  The strings that were generated first come first in the list.
 
         """
-        script = self._get_script()
-        generated = list(script.db.generated.get(self.name, []))
+        generated = list(self._get_generated().get(self.name, []))
         return generated
 
     def get(self, store=True, unique=True):
@@ -291,37 +365,62 @@ class RandomStringGenerator:
             Unless asked explicitly, the returned string can't repeat itself.
 
         """
-        script = self._get_script()
-        generated = script.db.generated.get(self.name)
+        return self.get_many(1, store=store, unique=unique)[0]
+
+    def get_many(self, number, store=True, unique=True):
+        """
+        Generate several pseudo-random strings according to the regular
+        expression.  This is faster than calling `get` repeatedly, since
+        the stored strings are only looked up, and saved, once.
+
+        Args:
+            number (int): the number of strings to generate.
+            store (bool, optional): store the generated strings in the script.
+            unique (bool, optional): keep on trying if a string is already used.
+
+        Returns:
+            results (list of str): the newly-generated strings.
+
+        Raises:
+            ExhaustedGenerator: if there aren't enough available strings
+            in this generator.
+
+        Note:
+            Unless asked explicitly, the returned strings can't repeat
+            themselves, nor each other.
+
+        """
+        all_generated = self._get_generated()
+        generated = all_generated.get(self.name)
         if generated is None:
-            script.db.generated[self.name] = []
-            generated = script.db.generated[self.name]
+            all_generated[self.name] = []
+            generated = all_generated[self.name]
 
-        if len(generated) >= self.total:
+        if len(generated) + number > self.total:
             raise ExhaustedGenerator
 
-        # Generate a pseudo-random string that might be used already
-        result = ""
-        for element in self.elements:
-            number = randint(element["min"], element["max"])
-            chars = element["chars"]
-            for index in range(number):
-                char = choice(chars)
-                result += char
-
-        # If the string has already been generated, try again
-        if result in generated and unique:
-            # Change the random seed, incrementing it slowly
-            epoch = time.time()
-            while result in generated:
-                epoch += 1
-                seed(epoch)
-                result = self.get(store=False, unique=False)
+        generated_set = self._get_generated_set(generated)
+
+        results = []
+        drawn = set()
+        for _ in range(number):
+            # Generate a pseudo-random string that might be used already
+            result = self._draw()
+
+            # If the string has already been generated, try again
+            if unique:
+                while result in generated_set or result in drawn:
+                    result = self._draw()
+                drawn.add(result)
+
+            results.append(result)
 
         if store:
-            generated.append(result)
+            # a single slice assignment saves the attribute only once
+            generated[len(generated) :] = results
+            generated_set.update(results)
 
-        return result
+        return results
 
     def remove(self, element):
         """
@@ -340,9 +439,9 @@ class RandomStringGenerator:
             calling the `get` method.
 
         """
-        script = self._get_script()
-        generated = script.db.generated.get(self.name, [])
-        if element not in generated:
+        generated = self._get_generated().get(self.name, [])
+        generated_set = self._get_generated_set(generated)
+        if element not in generated_set:
             raise ValueError(
                 "the string {} isn't stored as generated by the generator {}".format(
                     element, self.name
@@ -350,12 +449,13 @@ class RandomStringGenerator:
             )
 
         generated.remove(element)
+        generated_set.discard(element)
 
     def clear(self):
         """
         Clear the generator of all generated strings.
 
         """
-        script = self._get_script()
-        generated = script.db.generated.get(self.name, [])
+        generated = self._get_generated().get(self.name, [])
         generated[:] = []
+        self._generated_sets.pop(self.name, None)
@@ -24,3 +24,58 @@ class TestRandomStringGenerator(BaseEvenniaTest):
         # We can't generate one more
         with self.assertRaises(random_string_generator.ExhaustedGenerator):
             SIMPLE_GENERATOR.get()
+
+    def test_remove_and_clear(self):
+        """Removed strings can be generated again, cleared generators start over."""
+        generator = random_string_generator.RandomStringGenerator("removable", "[01]")
+        first = generator.get()
+        second = generator.get()
+        self.assertEqual(sorted([first, second]), ["0", "1"])
+
+        generator.remove(first)
+        self.assertEqual(generator.all(), [second])
+        # the change is saved, not only kept in memory
+        script = generator._get_script()
+        self.assertEqual(list(script.db.generated["removable"]), [second])
+        self.assertEqual(generator.get(), first)
+        with self.assertRaises(ValueError):
+            generator.remove("2")
+
+        generator.clear()
+        self.assertEqual(generator.all(), [])
+        self.assertEqual(sorted([generator.get(), generator.get()]), ["0", "1"])
+
+    def test_get_many(self):
+        """Generate a batch of distinct strings, refuse batches too large."""
+        generator = random_string_generator.RandomStringGenerator("batch", "[0-9]")
+        first = generator.get_many(6)
+        self.assertEqual(len(set(first)), 6)
+        self.assertEqual(sorted(generator.all()), sorted(first))
+
+        with self.assertRaises(random_string_generator.ExhaustedGenerator):
+            generator.get_many(5)
+
+        rest = generator.get_many(4)
+        self.assertEqual(sorted(first + rest), [str(digit) for digit in range(10)])
+        script = generator._get_script()
+        self.assertEqual(list(script.db.generated["batch"]), first + rest)
+
+    def test_parse_once(self):
+        """Generators with the same regex share its parsed elements."""
+        generator = random_string_generator.RandomStringGenerator("other simple", "[01]{2}")
+        self.assertIs(generator.elements, SIMPLE_GENERATOR.elements)
+        self.assertEqual(generator.total, 4)
+
+    def test_categories(self):
+        """Digit and word categories are understood."""
+        generator = random_string_generator.RandomStringGenerator("categories", r"\d\w")
+        self.assertEqual(generator.total, 10 * 63)
+        result = generator.get(store=False)
+        self.assertTrue(result[0].isdigit())
+        self.assertTrue(result[1].isalnum() or result[1] == "_")
+
+    def test_negated_class(self):
+        """Negated classes exclude their characters from letters and digits."""
+        generator = random_string_generator.RandomStringGenerator("negated", "[^A-Za-y0-8]")
+        self.assertEqual(generator.total, 2)
+        self.assertEqual(sorted(generator.elements[0]["chars"]), ["9", "z"])